@@ -4,6 +4,7 @@ import json
 from pathlib import Path
 
 from ..core.config_loader import config_loader
+from ..services.genre_enrichment import reset_genre_enrichment_manager
 
 router = APIRouter(prefix="/api/config", tags=["configuration"])
 
@@ -99,6 +100,8 @@ async def reload_configs() -> Dict[str, Any]:
     """Reload all configuration files"""
     try:
         config_loader.reload_config()
+        # Services and the genre cache were built from the old configuration
+        reset_genre_enrichment_manager()
         return {
             "status": "success",
             "message": "Configuration files reloaded successfully"
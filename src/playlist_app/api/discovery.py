@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
+from sqlalchemy import func, case
 from typing import List, Dict, Optional
 import os
 
@@ -84,18 +85,17 @@ async def get_discovery_stats(discovery_service: DiscoveryService = Depends(get_
         
         db = discovery_service.db
         
-        # Get total files
-        total_files = db.query(File).filter(File.is_active == True).count()
+        # Get per-extension totals and analyzed counts in a single grouped pass
+        extension_rows = db.query(
+            File.file_extension,
+            func.count(File.id),
+            func.count(case((File.is_analyzed == True, 1)))
+        ).filter(File.is_active == True).\
+            group_by(File.file_extension).all()
         
-        # Get analyzed files
-        analyzed_files = db.query(File).filter(File.is_active == True, File.is_analyzed == True).count()
-        
-        # Get files by extension
-        extension_stats = {}
-        files = db.query(File).filter(File.is_active == True).all()
-        for file in files:
-            ext = file.file_extension
-            extension_stats[ext] = extension_stats.get(ext, 0) + 1
+        extension_stats = {ext: count for ext, count, _ in extension_rows}
+        total_files = sum(count for _, count, _ in extension_rows)
+        analyzed_files = sum(analyzed for _, _, analyzed in extension_rows)
         
         return {
             "status": "success",
@@ -18,17 +18,18 @@ class ConfigLoader:
             
         config_file = self.config_dir / f"{config_name}.json"
         
-        if not config_file.exists():
-            return {}
-            
         try:
             with open(config_file, 'r', encoding='utf-8') as f:
                 config = json.load(f)
-                self._config_cache[config_name] = config
-                return config
+        except FileNotFoundError:
+            # Cache missing files too, so fallbacks don't hit the disk on every call
+            config = {}
         except (json.JSONDecodeError, IOError) as e:
             print(f"Warning: Could not load config {config_name}: {e}")
             return {}
+        
+        self._config_cache[config_name] = config
+        return config
     
     def get_discovery_config(self) -> Dict[str, Any]:
         """Get discovery configuration with fallback to environment variables"""
@@ -48,7 +49,8 @@ class ConfigLoader:
                     "batch_size": DiscoveryConfig.DISCOVERY_BATCH_SIZE,
                     "recursive": True,
                     "follow_symlinks": False,
-                    "max_file_size": 1073741824
+                    "max_file_size": 1073741824,
+                    "metadata_workers": 4
                 },
                 "hash_settings": {
                     "algorithm": "md5",
@@ -8,9 +8,16 @@ import time
 import logging
 from typing import Dict, Optional, List
 from urllib.parse import quote
+from .genre_tags import NON_GENRE_TAGS, PRAISE_TAGS, GENRE_INDICATORS, ELECTRONIC_GENRE_INDICATORS, is_genre_tag
 
 logger = logging.getLogger(__name__)
 
+_NON_GENRE_TAGS = NON_GENRE_TAGS | PRAISE_TAGS
+_GENRE_INDICATORS = GENRE_INDICATORS + ELECTRONIC_GENRE_INDICATORS
+
+# Genre keywords looked up in artist profile text, in priority order
+_PROFILE_GENRE_KEYWORDS = GENRE_INDICATORS + ('edm',)
+
 class DiscogsService:
     """Service for querying Discogs API for genre information"""
     
@@ -23,6 +30,11 @@ class DiscogsService:
         self.user_agent = config.get('user_agent', 'PlaylistApp/1.0')
         self.enabled = config.get('enabled', True)
         
+        self.session = requests.Session()
+        self.session.headers['User-Agent'] = self.user_agent
+        if self.api_key:
+            self.session.headers['Authorization'] = f'Discogs key={self.api_key}'
+        
         # Rate limiting
         self.last_request_time = 0
         self.min_request_interval = 1.0 / self.rate_limit if self.rate_limit > 0 else 1.0
@@ -45,14 +57,7 @@ class DiscogsService:
             self._rate_limit()
             
             url = f"{self.base_url}{endpoint}"
-            headers = {
-                'User-Agent': self.user_agent
-            }
-            
-            if self.api_key:
-                headers['Authorization'] = f'Discogs key={self.api_key}'
-            
-            response = requests.get(url, headers=headers, params=params, timeout=self.timeout)
+            response = self.session.get(url, params=params, timeout=self.timeout)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -147,15 +152,7 @@ class DiscogsService:
             # Look for genre mentions in the profile text
             profile_lower = profile.lower()
             
-            genre_keywords = [
-                'rock', 'pop', 'electronic', 'hip hop', 'jazz', 'classical',
-                'country', 'folk', 'blues', 'reggae', 'punk', 'metal',
-                'dance', 'house', 'trance', 'techno', 'dubstep', 'ambient',
-                'indie', 'alternative', 'r&b', 'soul', 'funk', 'disco',
-                'latin', 'world', 'experimental', 'soundtrack', 'edm'
-            ]
-            
-            for keyword in genre_keywords:
+            for keyword in _PROFILE_GENRE_KEYWORDS:
                 if keyword in profile_lower:
                     return keyword.title()
         
@@ -163,32 +160,7 @@ class DiscogsService:
     
     def _is_genre_tag(self, tag_name: str) -> bool:
         """Check if a tag is likely a genre tag"""
-        # Common non-genre tags to exclude
-        non_genre_tags = {
-            'favorites', 'favourite', 'favorite', 'favourites',
-            'seen live', 'seen-live', 'live', 'studio',
-            'instrumental', 'vocal', 'acoustic', 'electric',
-            'remix', 'cover', 'original', 'demo',
-            'single', 'album', 'ep', 'compilation',
-            'explicit', 'clean', 'radio edit',
-            'female vocalists', 'male vocalists',
-            'awesome', 'beautiful', 'amazing', 'great'
-        }
-        
-        if tag_name.lower() in non_genre_tags:
-            return False
-        
-        # Common genre indicators
-        genre_indicators = [
-            'rock', 'pop', 'electronic', 'hip hop', 'jazz', 'classical',
-            'country', 'folk', 'blues', 'reggae', 'punk', 'metal',
-            'dance', 'house', 'trance', 'techno', 'dubstep', 'ambient',
-            'indie', 'alternative', 'r&b', 'soul', 'funk', 'disco',
-            'latin', 'world', 'experimental', 'soundtrack', 'edm',
-            'progressive', 'deep', 'minimal', 'tech', 'acid', 'hardcore'
-        ]
-        
-        return any(indicator in tag_name.lower() for indicator in genre_indicators)
+        return is_genre_tag(tag_name.lower(), _NON_GENRE_TAGS, _GENRE_INDICATORS)
     
     def enrich_metadata(self, metadata: Dict) -> Dict:
         """Enrich metadata with genre information from Discogs"""
@@ -6,8 +6,9 @@ from datetime import datetime
 from sqlalchemy.orm import Session
 from ..models.database import File, DiscoveryCache, get_db
 from ..core.config import DiscoveryConfig
+from ..core.config_loader import config_loader
 from ..core.logging import get_logger
-from .metadata import audio_metadata_analyzer
+from .metadata import get_audio_metadata_analyzer
 
 logger = get_logger(__name__)
 
@@ -21,6 +22,12 @@ class DiscoveryService:
         self.search_directories = search_directories or DiscoveryConfig.get_search_directories()
         self.supported_extensions = supported_extensions or DiscoveryConfig.get_supported_extensions()
         
+        scan_settings = config_loader.get_discovery_config().get("scan_settings", {})
+        self.max_file_size = scan_settings.get("max_file_size")
+        self.recursive = scan_settings.get("recursive", True)
+        self.follow_symlinks = scan_settings.get("follow_symlinks", False)
+        self.metadata_workers = scan_settings.get("metadata_workers", 4)
+        
     def calculate_file_hash(self, file_name: str, file_size: int) -> str:
         """Calculate hash from filename + filesize"""
         hash_input = f"{file_name}_{file_size}".encode('utf-8')
@@ -30,10 +37,11 @@ class DiscoveryService:
         """Get file information"""
         try:
             path = Path(file_path)
-            if not path.exists():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
                 return None
-                
-            stat = path.stat()
+            
             file_name = path.name
             file_size = stat.st_size
             file_extension = path.suffix.lower()
@@ -41,6 +49,11 @@ class DiscoveryService:
             # Check if extension is supported
             if file_extension not in self.supported_extensions:
                 return None
+            
+            # Skip oversized files before hashing or metadata extraction
+            if self.max_file_size and file_size > self.max_file_size:
+                logger.warning(f"Skipping file larger than max_file_size ({self.max_file_size} bytes): {file_path}")
+                return None
                 
             file_hash = self.calculate_file_hash(file_name, file_size)
             
@@ -56,16 +69,44 @@ class DiscoveryService:
             logger.error(f"Error getting file info for {file_path}: {e}")
             return None
     
-    def get_cached_file_info(self, file_path: str) -> Dict:
-        """Get file info from cache if available"""
-        cache_entry = self.db.query(DiscoveryCache).filter(
-            DiscoveryCache.file_path == file_path
-        ).first()
+    def iter_audio_files(self, search_dir: str):
+        """Yield paths of files with a supported extension under search_dir"""
+        extensions = {ext.lower() for ext in self.supported_extensions}
+        pending = [search_dir]
+        # (device, inode) of scanned directories, so symlink loops are walked once
+        visited_dirs = set()
         
+        while pending:
+            current_dir = pending.pop()
+            try:
+                dir_stat = os.stat(current_dir)
+                dir_key = (dir_stat.st_dev, dir_stat.st_ino)
+                if dir_key in visited_dirs:
+                    continue
+                visited_dirs.add(dir_key)
+                
+                with os.scandir(current_dir) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=self.follow_symlinks):
+                                if self.recursive:
+                                    pending.append(entry.path)
+                            elif os.path.splitext(entry.name)[1].lower() in extensions and entry.is_file():
+                                yield entry.path
+                        except OSError as e:
+                            logger.warning(f"Error reading directory entry {entry.path}: {e}")
+            except OSError as e:
+                logger.warning(f"Error scanning directory {current_dir}: {e}")
+    
+    def get_cached_file_info(self, file_path: str, cache_entry: DiscoveryCache) -> Dict:
+        """Get file info from a prefetched cache entry if it is still valid"""
         if cache_entry:
             # Check if file still exists and size matches
             try:
                 current_size = Path(file_path).stat().st_size
+                # Oversized files fall through to get_file_info, which skips them
+                if self.max_file_size and current_size > self.max_file_size:
+                    return None
                 if current_size == cache_entry.file_size:
                     return {
                         "file_path": cache_entry.file_path,
@@ -76,18 +117,13 @@ class DiscoveryService:
                         "last_modified": cache_entry.last_checked
                     }
             except (OSError, FileNotFoundError):
-                # File no longer exists, remove from cache
+                # File no longer exists, remove from cache (committed with the scan)
                 self.db.delete(cache_entry)
-                self.db.commit()
                 
         return None
     
-    def update_cache(self, file_info: Dict):
-        """Update or create cache entry"""
-        cache_entry = self.db.query(DiscoveryCache).filter(
-            DiscoveryCache.file_path == file_info["file_path"]
-        ).first()
-        
+    def update_cache(self, file_info: Dict, cache_entry: DiscoveryCache = None) -> DiscoveryCache:
+        """Update or create cache entry (the caller commits)"""
         if cache_entry:
             cache_entry.file_size = file_info["file_size"]
             cache_entry.file_hash = file_info["file_hash"]
@@ -101,7 +137,7 @@ class DiscoveryService:
             )
             self.db.add(cache_entry)
         
-        self.db.commit()
+        return cache_entry
     
     def discover_files(self) -> Dict[str, List[str]]:
         """Discover files in search directories"""
@@ -113,16 +149,23 @@ class DiscoveryService:
         
         logger.info(f"Starting file discovery - Search directories: {self.search_directories}, Supported extensions: {self.supported_extensions}")
         
-        # Get all currently tracked files
-        tracked_files = set()
-        for file_record in self.db.query(File).filter(File.is_active == True).all():
-            tracked_files.add(file_record.file_path)
+        # Get all currently tracked files (paths only, no full File objects)
+        tracked_files = {
+            file_path
+            for (file_path,) in self.db.query(File.file_path).filter(File.is_active == True)
+        }
         
         logger.debug(f"Found {len(tracked_files)} currently tracked files")
         
+        # Load the whole discovery cache up front instead of querying it per file
+        cache_entries = {
+            entry.file_path: entry
+            for entry in self.db.query(DiscoveryCache).all()
+        }
+        
         # Discover current files
         current_files = set()
-        discovered_files = []
+        discovered_files: Dict[str, Dict] = {}
         
         for search_dir in self.search_directories:
             if not os.path.exists(search_dir):
@@ -131,26 +174,31 @@ class DiscoveryService:
                 
             logger.info(f"Scanning directory: {search_dir}")
             
-            for root, dirs, files in os.walk(search_dir):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    
-                    # Check cache first
-                    cached_info = self.get_cached_file_info(file_path)
-                    if cached_info:
-                        current_files.add(file_path)
-                        discovered_files.append(cached_info)
-                        results["unchanged"].append(file_path)
-                        continue
+            for file_path in self.iter_audio_files(search_dir):
+                # Overlapping search directories can yield the same file twice
+                if file_path in current_files:
+                    continue
+                
+                # Check cache first
+                cache_entry = cache_entries.get(file_path)
+                cached_info = self.get_cached_file_info(file_path, cache_entry)
+                if cached_info:
+                    current_files.add(file_path)
+                    discovered_files[file_path] = cached_info
+                    results["unchanged"].append(file_path)
+                    continue
+                
+                # Get fresh file info
+                file_info = self.get_file_info(file_path)
+                if file_info:
+                    current_files.add(file_path)
+                    discovered_files[file_path] = file_info
                     
-                    # Get fresh file info
-                    file_info = self.get_file_info(file_path)
-                    if file_info:
-                        current_files.add(file_path)
-                        discovered_files.append(file_info)
-                        
-                        # Update cache
-                        self.update_cache(file_info)
+                    # Update cache (entry may exist if the file size changed)
+                    cache_entries[file_path] = self.update_cache(file_info, cache_entry)
+        
+        # Commit all cache updates from this scan at once
+        self.db.commit()
         
         # Find added and removed files
         added_files = current_files - tracked_files
@@ -159,22 +207,39 @@ class DiscoveryService:
         logger.debug(f"Found {len(added_files)} new files and {len(removed_files)} removed files")
         
         # Process added files
+        new_file_paths = []
         for file_path in added_files:
-            file_info = next((f for f in discovered_files if f["file_path"] == file_path), None)
+            file_info = discovered_files.get(file_path)
             if file_info:
-                self.add_file_to_db(file_info)
+                if self.add_file_to_db(file_info):
+                    new_file_paths.append(file_path)
                 results["added"].append(file_path)
         
+        # Extract metadata for all new files in one batch (tags are read concurrently)
+        if new_file_paths:
+            try:
+                logger.info(f"Extracting metadata for {len(new_file_paths)} new files")
+                summary = get_audio_metadata_analyzer().analyze_multiple_files(
+                    new_file_paths, self.db, max_workers=self.metadata_workers
+                )
+                logger.info(f"Metadata extraction complete - Successful: {summary['successful']}, Failed: {summary['failed']}")
+            except Exception as metadata_error:
+                logger.error(f"Error extracting metadata for new files: {metadata_error}")
+        
         # Process removed files
-        for file_path in removed_files:
-            self.remove_file_from_db(file_path)
-            results["removed"].append(file_path)
+        if removed_files:
+            self.remove_files_from_db(list(removed_files))
+            results["removed"].extend(removed_files)
         
         logger.info(f"Discovery complete - Added: {len(results['added'])}, Removed: {len(results['removed'])}, Unchanged: {len(results['unchanged'])}, Total processed: {len(current_files)}")
         return results
     
-    def add_file_to_db(self, file_info: Dict):
-        """Add new file to database and extract metadata"""
+    def add_file_to_db(self, file_info: Dict) -> bool:
+        """Add new file to database
+        
+        Returns True if a new file record was added. Metadata is extracted
+        by the caller, in one batch for all new files.
+        """
         try:
             # Check if file with same hash already exists
             existing_file = self.db.query(File).filter(
@@ -183,7 +248,7 @@ class DiscoveryService:
             
             if existing_file:
                 logger.info(f"File with same hash already exists: {file_info['file_name']}")
-                return
+                return False
             
             # Create new file record
             new_file = File(
@@ -200,40 +265,31 @@ class DiscoveryService:
             self.db.add(new_file)
             self.db.commit()
             logger.info(f"Added file to database: {file_info['file_name']}")
-            
-            # Extract metadata immediately after adding file
-            try:
-                logger.info(f"Extracting metadata for: {file_info['file_name']}")
-                metadata = audio_metadata_analyzer.analyze_file(file_info["file_path"], self.db)
-                if metadata:
-                    logger.info(f"Successfully extracted metadata for: {file_info['file_name']}")
-                else:
-                    logger.warning(f"No metadata extracted for: {file_info['file_name']}")
-            except Exception as metadata_error:
-                logger.error(f"Error extracting metadata for {file_info['file_name']}: {metadata_error}")
+            return True
             
         except Exception as e:
             logger.error(f"Error adding file to database: {e}")
             self.db.rollback()
+            return False
     
-    def remove_file_from_db(self, file_path: str):
-        """Remove file from database and trigger playlist cleanup"""
+    def remove_files_from_db(self, file_paths: List[str]):
+        """Remove many files from database with batched updates"""
         try:
-            file_record = self.db.query(File).filter(
-                File.file_path == file_path
-            ).first()
+            batch_size = DiscoveryConfig.DISCOVERY_BATCH_SIZE
+            updated = 0
+            for start in range(0, len(file_paths), batch_size):
+                updated += self.db.query(File).filter(
+                    File.file_path.in_(file_paths[start:start + batch_size]),
+                    File.is_active == True
+                ).update({File.is_active: False}, synchronize_session=False)
+            self.db.commit()
+            logger.info(f"Removed {updated} files from database")
+            
+            # TODO: Trigger playlist cleanup to remove these files from playlists
+            # This will be implemented when playlist system is added
             
-            if file_record:
-                # Mark as inactive instead of deleting to preserve history
-                file_record.is_active = False
-                self.db.commit()
-                logger.info(f"Removed file from database: {file_path}")
-                
-                # TODO: Trigger playlist cleanup to remove this file from playlists
-                # This will be implemented when playlist system is added
-                
         except Exception as e:
-            logger.error(f"Error removing file from database: {e}")
+            logger.error(f"Error removing files from database: {e}")
             self.db.rollback()
     
     def get_discovered_files(self, limit: int = 100, offset: int = 0) -> List[Dict]:
@@ -3,8 +3,11 @@
 Genre Enrichment Manager - Orchestrates multiple API services for genre detection
 """
 
+import functools
 import logging
-from typing import Dict, Optional
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Tuple
 from .musicbrainz import musicbrainz_service
 from .lastfm import LastFMService
 from .discogs import DiscogsService
@@ -12,6 +15,9 @@ from ..core.config_loader import config_loader
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of genre lookups remembered by the manager
+GENRE_CACHE_MAX_SIZE = 10000
+
 class GenreEnrichmentManager:
     """Manages genre enrichment using multiple API services in fallback order"""
     
@@ -30,10 +36,20 @@ class GenreEnrichmentManager:
             ('Last.fm', self.lastfm_service),
             ('Discogs', self.discogs_service)
         ]
+        
+        # Genres found by previous lookups keyed by (artist, title, album), least
+        # recently used first. Misses are not cached: the services swallow
+        # request errors, so a miss may just be a timeout or rate limit.
+        self._genre_cache: "OrderedDict[Tuple[str, str, str], str]" = OrderedDict()
+        # The shared manager is used from the API threadpool
+        self._genre_cache_lock = threading.Lock()
     
     def enrich_metadata(self, metadata: Dict) -> Dict:
         """Enrich metadata with genre information using multiple services"""
-        if not metadata:
+        # Disabled or unconfigured services are skipped up front instead of
+        # being tried for every track
+        active_services = self.get_active_services()
+        if not metadata or not active_services:
             return metadata
         
         # Skip if we already have a good genre
@@ -47,10 +63,20 @@ class GenreEnrichmentManager:
         if not artist or not title:
             return metadata
         
+        cache_key = (artist.lower(), title.lower(), (metadata.get('album') or '').lower())
+        with self._genre_cache_lock:
+            cached_genre = self._genre_cache.get(cache_key)
+            if cached_genre:
+                self._genre_cache.move_to_end(cache_key)
+        if cached_genre:
+            metadata['genre'] = cached_genre
+            logger.debug(f"Using cached genre for: {artist} - {title}")
+            return metadata
+        
         logger.info(f"Starting genre enrichment for: {artist} - {title}")
         
         # Try each service in order until we find a genre
-        for service_name, service in self.services:
+        for service_name, service in active_services:
             try:
                 logger.info(f"Trying {service_name} for genre enrichment...")
                 
@@ -61,6 +87,7 @@ class GenreEnrichmentManager:
                 new_genre = enriched_metadata.get('genre', '').lower()
                 if new_genre and new_genre not in ['other', 'unknown', 'none', '']:
                     metadata['genre'] = enriched_metadata['genre']
+                    self._cache_genre(cache_key, enriched_metadata['genre'])
                     logger.info(f"✓ Found genre '{enriched_metadata['genre']}' using {service_name}")
                     return metadata
                 else:
@@ -73,6 +100,27 @@ class GenreEnrichmentManager:
         logger.warning(f"No genre found for {artist} - {title} using any service")
         return metadata
     
+    def _cache_genre(self, cache_key: Tuple[str, str, str], genre: str):
+        """Remember a found genre, evicting the least recently used entry when full"""
+        with self._genre_cache_lock:
+            self._genre_cache[cache_key] = genre
+            self._genre_cache.move_to_end(cache_key)
+            if len(self._genre_cache) > GENRE_CACHE_MAX_SIZE:
+                self._genre_cache.popitem(last=False)
+    
+    def clear_cache(self):
+        """Clear cached genre lookups"""
+        with self._genre_cache_lock:
+            self._genre_cache.clear()
+    
+    def get_active_services(self) -> List[Tuple[str, object]]:
+        """Get the enabled and configured services in priority order"""
+        service_status = self.get_service_status()
+        return [
+            (service_name, service) for service_name, service in self.services
+            if service_status[service_name]['enabled'] and service_status[service_name]['configured']
+        ]
+    
     def get_service_status(self) -> Dict:
         """Get status of all genre enrichment services"""
         status = {}
@@ -80,8 +128,8 @@ class GenreEnrichmentManager:
         for service_name, service in self.services:
             if service_name == 'MusicBrainz':
                 status[service_name] = {
-                    'enabled': True,  # MusicBrainz is always enabled
-                    'configured': True
+                    'enabled': self.external_apis_config.get('musicbrainz', {}).get('enabled', True),
+                    'configured': True  # MusicBrainz needs no API key
                 }
             elif hasattr(service, 'enabled'):
                 status[service_name] = {
@@ -138,5 +186,12 @@ class GenreEnrichmentManager:
         
         return results
 
-# Global instance
-genre_enrichment_manager = GenreEnrichmentManager()
+# Global instance, created on first use
+@functools.cache
+def get_genre_enrichment_manager() -> GenreEnrichmentManager:
+    """Get the shared enrichment manager, creating it on first use"""
+    return GenreEnrichmentManager()
+
+def reset_genre_enrichment_manager():
+    """Drop the shared manager so the next use picks up reloaded configuration"""
+    get_genre_enrichment_manager.cache_clear()
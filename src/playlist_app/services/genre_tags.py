@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Tag vocabularies shared by the genre enrichment services
+"""
+
+from typing import Iterable
+
+# Common non-genre tags to exclude; services add their own extras
+NON_GENRE_TAGS = frozenset({
+    'favorites', 'favourite', 'favorite', 'favourites',
+    'seen live', 'seen-live', 'live', 'studio',
+    'instrumental', 'vocal', 'acoustic', 'electric',
+    'remix', 'cover', 'original', 'demo',
+    'single', 'album', 'ep', 'compilation',
+    'explicit', 'clean', 'radio edit',
+    'female vocalists', 'male vocalists'
+})
+
+# Listener-count tags used by Last.fm style folksonomies
+LISTENER_COUNT_TAGS = frozenset({'under 2000 listeners', 'under 1000 listeners'})
+
+# Praise words that show up as user tags
+PRAISE_TAGS = frozenset({'awesome', 'beautiful', 'amazing', 'great'})
+
+# Common genre indicators, in priority order
+GENRE_INDICATORS = (
+    'rock', 'pop', 'electronic', 'hip hop', 'jazz', 'classical',
+    'country', 'folk', 'blues', 'reggae', 'punk', 'metal',
+    'dance', 'house', 'trance', 'techno', 'dubstep', 'ambient',
+    'indie', 'alternative', 'r&b', 'soul', 'funk', 'disco',
+    'latin', 'world', 'experimental', 'soundtrack'
+)
+
+# Electronic sub-genre indicators
+ELECTRONIC_GENRE_INDICATORS = (
+    'edm', 'progressive', 'deep', 'minimal', 'tech', 'acid', 'hardcore'
+)
+
+def is_genre_tag(tag_name: str, non_genre_tags: frozenset, genre_indicators: Iterable[str]) -> bool:
+    """Check if a lowercased tag is likely a genre tag"""
+    if tag_name in non_genre_tags:
+        return False
+
+    return any(indicator in tag_name for indicator in genre_indicators)
@@ -8,9 +8,18 @@ import time
 import logging
 from typing import Dict, Optional, List
 from urllib.parse import quote
+from .genre_tags import (
+    NON_GENRE_TAGS, LISTENER_COUNT_TAGS, PRAISE_TAGS,
+    GENRE_INDICATORS, ELECTRONIC_GENRE_INDICATORS, is_genre_tag
+)
 
 logger = logging.getLogger(__name__)
 
+_NON_GENRE_TAGS = NON_GENRE_TAGS | LISTENER_COUNT_TAGS | PRAISE_TAGS | {
+    'love', 'romantic', 'sad', 'happy', 'energetic'
+}
+_GENRE_INDICATORS = GENRE_INDICATORS + ELECTRONIC_GENRE_INDICATORS
+
 class LastFMService:
     """Service for querying Last.fm API for genre information"""
     
@@ -22,6 +31,8 @@ class LastFMService:
         self.timeout = config.get('timeout', 10)
         self.enabled = config.get('enabled', True)
         
+        self.session = requests.Session()
+        
         # Rate limiting
         self.last_request_time = 0
         self.min_request_interval = 1.0 / self.rate_limit if self.rate_limit > 0 else 1.0
@@ -49,7 +60,7 @@ class LastFMService:
                 'format': 'json'
             })
             
-            response = requests.get(self.base_url, params=params, timeout=self.timeout)
+            response = self.session.get(self.base_url, params=params, timeout=self.timeout)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -117,34 +128,7 @@ class LastFMService:
     
     def _is_genre_tag(self, tag_name: str) -> bool:
         """Check if a tag is likely a genre tag"""
-        # Common non-genre tags to exclude
-        non_genre_tags = {
-            'favorites', 'favourite', 'favorite', 'favourites',
-            'seen live', 'seen-live', 'live', 'studio',
-            'instrumental', 'vocal', 'acoustic', 'electric',
-            'remix', 'cover', 'original', 'demo',
-            'single', 'album', 'ep', 'compilation',
-            'explicit', 'clean', 'radio edit',
-            'female vocalists', 'male vocalists',
-            'under 2000 listeners', 'under 1000 listeners',
-            'awesome', 'beautiful', 'amazing', 'great',
-            'love', 'romantic', 'sad', 'happy', 'energetic'
-        }
-        
-        if tag_name in non_genre_tags:
-            return False
-        
-        # Common genre indicators
-        genre_indicators = [
-            'rock', 'pop', 'electronic', 'hip hop', 'jazz', 'classical',
-            'country', 'folk', 'blues', 'reggae', 'punk', 'metal',
-            'dance', 'house', 'trance', 'techno', 'dubstep', 'ambient',
-            'indie', 'alternative', 'r&b', 'soul', 'funk', 'disco',
-            'latin', 'world', 'experimental', 'soundtrack', 'edm',
-            'progressive', 'deep', 'minimal', 'tech', 'acid', 'hardcore'
-        ]
-        
-        return any(indicator in tag_name for indicator in genre_indicators)
+        return is_genre_tag(tag_name, _NON_GENRE_TAGS, _GENRE_INDICATORS)
     
     def enrich_metadata(self, metadata: Dict) -> Dict:
         """Enrich metadata with genre information from Last.fm"""
@@ -1,7 +1,12 @@
 import os
+import math
 import logging
-from typing import Dict, Any, Optional, List
+import functools
+from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 import mutagen
 from mutagen.easyid3 import EasyID3
 from mutagen.id3 import ID3
@@ -16,10 +21,29 @@ from datetime import datetime
 
 from ..models.database import File, AudioMetadata
 from ..core.config_loader import config_loader
-from .genre_enrichment import genre_enrichment_manager
+from .genre_enrichment import get_genre_enrichment_manager
 
 logger = logging.getLogger(__name__)
 
+# AudioMetadata columns that extracted metadata may be saved to
+_AUDIO_METADATA_FIELDS = frozenset({
+    'title', 'artist', 'album', 'track_number', 'year', 'genre',
+    'album_artist', 'disc_number', 'composer', 'duration', 'bpm', 'key',
+    'comment', 'mood', 'rating', 'isrc', 'encoder', 'bitrate', 'sample_rate',
+    'channels', 'format', 'file_size', 'file_format', 'replaygain_track_gain',
+    'replaygain_album_gain', 'replaygain_track_peak', 'replaygain_album_peak',
+    'musicbrainz_track_id', 'musicbrainz_artist_id', 'musicbrainz_album_id',
+    'musicbrainz_album_artist_id'
+})
+
+def _safe_float(value: Any) -> Optional[float]:
+    """Convert a tag value to a finite float, or None if not possible"""
+    try:
+        result = float(value)
+    except (TypeError, ValueError):
+        return None
+    return result if math.isfinite(result) else None
+
 class AudioMetadataAnalyzer:
     """Audio metadata analyzer using Mutagen with focused playlist-relevant mappings"""
     
@@ -172,27 +196,53 @@ class AudioMetadataAnalyzer:
         """Analyze audio file and extract metadata"""
         try:
             file_path = Path(file_path)
-            if not file_path.exists():
-                logger.error(f"File not found: {file_path}")
-                return None
-            
-            # Get file extension
-            extension = file_path.suffix.lower()
-            if extension not in self.supported_formats:
-                logger.warning(f"Unsupported format: {extension}")
+            file_data = self._read_raw_metadata(file_path)
+            if not file_data:
                 return None
             
-            # Extract raw metadata
-            raw_metadata = self.supported_formats[extension](file_path)
-            if not raw_metadata:
-                logger.warning(f"No metadata found for: {file_path}")
-                return None
+            raw_metadata, technical_info = file_data
+            return self._process_raw_metadata(file_path, raw_metadata, technical_info, db)
             
+        except Exception as e:
+            logger.error(f"Error analyzing {file_path}: {str(e)}")
+            return None
+    
+    def _read_raw_metadata(self, file_path: Path) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """Read raw tags, audio info and technical info from file (no database access)"""
+        # A single stat both checks existence and provides the technical info
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
+            logger.error(f"File not found: {file_path}")
+            return None
+        
+        # Empty files have nothing for Mutagen to parse
+        if stat.st_size == 0:
+            logger.warning(f"Empty file, skipping metadata extraction: {file_path}")
+            return None
+        
+        # Get file extension
+        extension = file_path.suffix.lower()
+        if extension not in self.supported_formats:
+            logger.warning(f"Unsupported format: {extension}")
+            return None
+        
+        # Extract raw metadata
+        raw_metadata = self.supported_formats[extension](file_path)
+        if not raw_metadata:
+            logger.warning(f"No metadata found for: {file_path}")
+            return None
+        
+        return raw_metadata, self._extract_technical_info(file_path, stat)
+    
+    def _process_raw_metadata(self, file_path: Path, raw_metadata: Dict[str, Any],
+                              technical_info: Dict[str, Any], db: Session) -> Optional[Dict[str, Any]]:
+        """Normalize raw metadata, enrich it and save it to the database"""
+        try:
             # Normalize metadata using mapping
             normalized_metadata = self._normalize_metadata(raw_metadata)
             
             # Add technical information
-            technical_info = self._extract_technical_info(file_path)
             normalized_metadata.update(technical_info)
             
             # Save to database
@@ -219,10 +269,18 @@ class AudioMetadataAnalyzer:
             except Exception as e:
                 logger.debug(f"EasyID3 extraction failed: {e}")
             
-            # Try ID3 for extended metadata
+            # Parse the file once for both the ID3 frames and the audio info
+            audio = None
+            try:
+                audio = MP3(str(file_path))
+            except Exception as e:
+                logger.debug(f"MP3 info extraction failed: {e}")
+            
+            # Try ID3 for extended metadata (read the tag on its own only if
+            # the MPEG stream itself could not be parsed)
             try:
-                audio = ID3(str(file_path))
-                for key, frame in audio.items():
+                id3_tags = audio.tags if audio is not None else ID3(str(file_path))
+                for key, frame in (id3_tags or {}).items():
                     if hasattr(frame, 'text') and frame.text:
                         # Handle ID3TimeStamp objects
                         if hasattr(frame.text[0], 'year'):
@@ -235,14 +293,10 @@ class AudioMetadataAnalyzer:
                 logger.debug(f"ID3 extraction failed: {e}")
             
             # Get basic audio info
-            try:
-                audio = MP3(str(file_path))
-                if audio.info:
-                    metadata['duration'] = audio.info.length
-                    metadata['bitrate'] = audio.info.bitrate
-                    metadata['sample_rate'] = audio.info.sample_rate
-            except Exception as e:
-                logger.debug(f"MP3 info extraction failed: {e}")
+            if audio is not None and audio.info:
+                metadata['duration'] = audio.info.length
+                metadata['bitrate'] = audio.info.bitrate
+                metadata['sample_rate'] = audio.info.sample_rate
                 
         except Exception as e:
             logger.error(f"Error extracting MP3 metadata: {e}")
@@ -402,8 +456,8 @@ class AudioMetadataAnalyzer:
         return normalized
     
     def _convert_data_types(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
-        """Convert metadata values to appropriate data types"""
-        converted = metadata.copy()
+        """Convert metadata values to appropriate data types (in place)"""
+        converted = metadata
         
         # Convert year field
         if 'year' in converted:
@@ -452,16 +506,9 @@ class AudioMetadataAnalyzer:
         # Convert bpm
         if 'bpm' in converted:
             bpm_value = converted['bpm']
-            if isinstance(bpm_value, str):
-                try:
-                    converted['bpm'] = float(bpm_value)
-                except ValueError:
-                    converted['bpm'] = None
-            elif isinstance(bpm_value, (int, float)):
-                if bpm_value > 0:
-                    converted['bpm'] = float(bpm_value)
-                else:
-                    converted['bpm'] = None
+            if isinstance(bpm_value, (str, int, float)):
+                bpm = _safe_float(bpm_value)
+                converted['bpm'] = bpm if bpm and bpm > 0 else None
         
         # Convert duration
         if 'duration' in converted:
@@ -477,36 +524,21 @@ class AudioMetadataAnalyzer:
             if field in converted:
                 value = converted[field]
                 if isinstance(value, str):
-                    try:
-                        # Remove "dB" and convert to float
-                        if 'dB' in value:
-                            numeric_value = value.replace('dB', '').strip()
-                            converted[field] = float(numeric_value)
-                        else:
-                            converted[field] = float(value)
-                    except ValueError:
-                        converted[field] = None
+                    # Remove "dB" before converting to float
+                    converted[field] = _safe_float(value.replace('dB', ''))
                 elif isinstance(value, (int, float)):
-                    converted[field] = float(value)
+                    converted[field] = _safe_float(value)
         
         # Convert numeric fields
         numeric_fields = ['bitrate', 'sample_rate', 'channels', 'rating']
         for field in numeric_fields:
             if field in converted:
                 value = converted[field]
-                if isinstance(value, str):
+                if isinstance(value, (str, int, float)):
                     try:
-                        if field in ['bitrate', 'sample_rate', 'channels', 'rating']:
-                            converted[field] = int(value)
-                        else:
-                            converted[field] = float(value)
-                    except ValueError:
-                        converted[field] = None
-                elif isinstance(value, (int, float)):
-                    if field in ['bitrate', 'sample_rate', 'channels', 'rating']:
                         converted[field] = int(value)
-                    else:
-                        converted[field] = float(value)
+                    except (ValueError, OverflowError):
+                        converted[field] = None
         
         return converted
     
@@ -526,7 +558,7 @@ class AudioMetadataAnalyzer:
                 return metadata
             
             # Use the genre enrichment manager to try multiple services
-            enriched_metadata = genre_enrichment_manager.enrich_metadata(metadata)
+            enriched_metadata = get_genre_enrichment_manager().enrich_metadata(metadata)
             
             return enriched_metadata
             
@@ -534,19 +566,14 @@ class AudioMetadataAnalyzer:
             logger.warning(f"Failed to enrich genre: {e}")
             return metadata
     
-    def _extract_technical_info(self, file_path: Path) -> Dict[str, Any]:
-        """Extract technical information about the file"""
-        try:
-            stat = file_path.stat()
-            return {
-                'file_size': stat.st_size,
-                'file_format': file_path.suffix.lower(),
-                'last_modified': stat.st_mtime,
-                'created_time': stat.st_ctime
-            }
-        except Exception as e:
-            logger.error(f"Error extracting technical info: {e}")
-            return {}
+    def _extract_technical_info(self, file_path: Path, stat: os.stat_result) -> Dict[str, Any]:
+        """Extract technical information about the file from its stat result"""
+        return {
+            'file_size': stat.st_size,
+            'file_format': file_path.suffix.lower(),
+            'last_modified': stat.st_mtime,
+            'created_time': stat.st_ctime
+        }
     
     def _save_metadata_to_db(self, file_path: Path, metadata: Dict[str, Any], db: Session):
         """Save metadata to database"""
@@ -558,17 +585,7 @@ class AudioMetadataAnalyzer:
                 return
             
             # Filter metadata to only include valid AudioMetadata fields
-            valid_fields = {
-                'title', 'artist', 'album', 'track_number', 'year', 'genre',
-                'album_artist', 'disc_number', 'composer', 'duration', 'bpm', 'key',
-                'comment', 'mood', 'rating', 'isrc', 'encoder', 'bitrate', 'sample_rate',
-                'channels', 'format', 'file_size', 'file_format', 'replaygain_track_gain',
-                'replaygain_album_gain', 'replaygain_track_peak', 'replaygain_album_peak',
-                'musicbrainz_track_id', 'musicbrainz_artist_id', 'musicbrainz_album_id',
-                'musicbrainz_album_artist_id'
-            }
-            
-            filtered_metadata = {k: v for k, v in metadata.items() if k in valid_fields}
+            filtered_metadata = {k: v for k, v in metadata.items() if k in _AUDIO_METADATA_FIELDS}
             
             # Log the metadata being saved for debugging
             logger.debug(f"Saving metadata for {file_path}: {filtered_metadata}")
@@ -613,8 +630,17 @@ class AudioMetadataAnalyzer:
             logger.error(f"Metadata that failed to save: {metadata}")
             raise
     
-    def analyze_multiple_files(self, file_paths: List[str], db: Session) -> Dict[str, Any]:
-        """Analyze multiple files and return summary"""
+    def analyze_multiple_files(self, file_paths: List[str], db: Session,
+                               max_workers: int = 4) -> Dict[str, Any]:
+        """Analyze multiple files and return summary
+        
+        Tag reading is independent per file and mostly I/O, so it runs in a
+        thread pool. Normalization, genre enrichment (rate limited) and the
+        database writes stay on the calling thread since the session and the
+        API services are not thread-safe. Only a small window of reads is kept
+        in flight so raw tags (which may include cover art) don't pile up while
+        the calling thread waits on enrichment.
+        """
         results = {
             'total_files': len(file_paths),
             'successful': 0,
@@ -622,18 +648,47 @@ class AudioMetadataAnalyzer:
             'errors': []
         }
         
-        for file_path in file_paths:
+        def read_file(file_path: str):
             try:
-                metadata = self.analyze_file(file_path, db)
+                return self._read_raw_metadata(Path(file_path)), None
+            except Exception as e:
+                return None, e
+        
+        max_workers = max(1, max_workers)
+        remaining_paths = iter(file_paths)
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Process results in input order while the next files are being read
+            pending = deque(
+                (file_path, executor.submit(read_file, file_path))
+                for file_path in islice(remaining_paths, max_workers * 2)
+            )
+            while pending:
+                file_path, future = pending.popleft()
+                next_path = next(remaining_paths, None)
+                if next_path is not None:
+                    pending.append((next_path, executor.submit(read_file, next_path)))
+                
+                file_data, read_error = future.result()
+                if read_error is not None:
+                    results['failed'] += 1
+                    results['errors'].append(f"{file_path}: {str(read_error)}")
+                    continue
+                
+                metadata = None
+                if file_data:
+                    raw_metadata, technical_info = file_data
+                    metadata = self._process_raw_metadata(Path(file_path), raw_metadata, technical_info, db)
+                
                 if metadata:
                     results['successful'] += 1
                 else:
                     results['failed'] += 1
-            except Exception as e:
-                results['failed'] += 1
-                results['errors'].append(f"{file_path}: {str(e)}")
         
         return results
 
-# Global analyzer instance
-audio_metadata_analyzer = AudioMetadataAnalyzer()
+# Global analyzer instance, created on first use
+@functools.cache
+def get_audio_metadata_analyzer() -> AudioMetadataAnalyzer:
+    """Get the shared analyzer instance, creating it on first use"""
+    return AudioMetadataAnalyzer()
@@ -8,9 +8,13 @@ import time
 import logging
 from typing import Dict, Optional, List
 from urllib.parse import quote
+from .genre_tags import NON_GENRE_TAGS, LISTENER_COUNT_TAGS, GENRE_INDICATORS, is_genre_tag
 
 logger = logging.getLogger(__name__)
 
+_NON_GENRE_TAGS = NON_GENRE_TAGS | LISTENER_COUNT_TAGS
+_GENRE_INDICATORS = GENRE_INDICATORS
+
 class MusicBrainzService:
     """Service for querying MusicBrainz API for genre information"""
     
@@ -19,6 +23,8 @@ class MusicBrainzService:
         self.headers = {
             'User-Agent': 'PlaylistApp/1.0 (dean@example.com)'
         }
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
         # Rate limiting: MusicBrainz allows 1 request per second
         self.last_request_time = 0
         self.min_request_interval = 1.0
@@ -37,7 +43,7 @@ class MusicBrainzService:
         try:
             self._rate_limit()
             url = f"{self.base_url}/{endpoint}"
-            response = requests.get(url, headers=self.headers, params=params, timeout=10)
+            response = self.session.get(url, params=params, timeout=10)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -123,31 +129,7 @@ class MusicBrainzService:
     
     def _is_genre_tag(self, tag_name: str) -> bool:
         """Check if a tag is likely a genre tag"""
-        # Common non-genre tags to exclude
-        non_genre_tags = {
-            'favorites', 'favourite', 'favorite', 'favourites',
-            'seen live', 'seen-live', 'live', 'studio',
-            'instrumental', 'vocal', 'acoustic', 'electric',
-            'remix', 'cover', 'original', 'demo',
-            'single', 'album', 'ep', 'compilation',
-            'explicit', 'clean', 'radio edit',
-            'female vocalists', 'male vocalists',
-            'under 2000 listeners', 'under 1000 listeners'
-        }
-        
-        if tag_name in non_genre_tags:
-            return False
-        
-        # Common genre indicators
-        genre_indicators = [
-            'rock', 'pop', 'electronic', 'hip hop', 'jazz', 'classical',
-            'country', 'folk', 'blues', 'reggae', 'punk', 'metal',
-            'dance', 'house', 'trance', 'techno', 'dubstep', 'ambient',
-            'indie', 'alternative', 'r&b', 'soul', 'funk', 'disco',
-            'latin', 'world', 'experimental', 'soundtrack'
-        ]
-        
-        return any(indicator in tag_name for indicator in genre_indicators)
+        return is_genre_tag(tag_name, _NON_GENRE_TAGS, _GENRE_INDICATORS)
     
     def enrich_metadata(self, metadata: Dict) -> Dict:
         """Enrich metadata with genre information from MusicBrainz"""
@@ -7,7 +7,9 @@ import os
 import tempfile
 import shutil
 from pathlib import Path
-from src.playlist_app.models.database import create_tables, SessionLocal
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from src.playlist_app.models.database import Base, DiscoveryCache, create_tables, SessionLocal
 from src.playlist_app.services.discovery import DiscoveryService
 from src.playlist_app.core.config import DiscoveryConfig
 
@@ -97,5 +99,77 @@ def test_discovery():
         shutil.rmtree(test_dir)
         print(f"Cleaned up test directory: {test_dir}")
 
+def make_session():
+    """Create a session on a fresh in-memory SQLite database"""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine)()
+
+def test_discovery_overlapping_directories(tmp_path):
+    """A file reachable from two search directories is discovered once"""
+    sub_dir = tmp_path / "sub"
+    sub_dir.mkdir()
+    create_test_files(str(sub_dir))
+    
+    db = make_session()
+    discovery_service = DiscoveryService(db, search_directories=[str(tmp_path), str(sub_dir)])
+    
+    results = discovery_service.discover_files()
+    assert sorted(Path(path).name for path in results["added"]) == [
+        "song1.mp3", "song2.wav", "song3.flac", "song4.ogg"
+    ]
+    assert db.query(DiscoveryCache).count() == 4
+    
+    # Second scan is served from the cache, still once per file
+    results = discovery_service.discover_files()
+    assert results["added"] == []
+    assert len(results["unchanged"]) == 4
+
+def test_discovery_max_file_size_applies_to_cached_files(tmp_path):
+    """Lowering max_file_size drops files that are already in the cache"""
+    create_test_files(str(tmp_path))
+    
+    db = make_session()
+    discovery_service = DiscoveryService(db, search_directories=[str(tmp_path)])
+    discovery_service.max_file_size = None
+    assert len(discovery_service.discover_files()["added"]) == 4
+    
+    # song3.flac is one byte longer than the other test files
+    discovery_service.max_file_size = len("Test content for song1.mp3")
+    results = discovery_service.discover_files()
+    assert sorted(Path(path).name for path in results["unchanged"]) == ["song1.mp3", "song2.wav", "song4.ogg"]
+    assert [Path(path).name for path in results["removed"]] == ["song3.flac"]
+
+def test_iter_audio_files(tmp_path):
+    """Only supported extensions are yielded, recursively by default"""
+    create_test_files(str(tmp_path))
+    nested_dir = tmp_path / "album"
+    nested_dir.mkdir()
+    (nested_dir / "track.MP3").write_text("Test content")
+    (nested_dir / "cover.jpg").write_text("Test content")
+    
+    discovery_service = DiscoveryService(None, search_directories=[str(tmp_path)])
+    found = sorted(Path(path).name for path in discovery_service.iter_audio_files(str(tmp_path)))
+    assert found == ["song1.mp3", "song2.wav", "song3.flac", "song4.ogg", "track.MP3"]
+    
+    discovery_service.recursive = False
+    found = sorted(Path(path).name for path in discovery_service.iter_audio_files(str(tmp_path)))
+    assert found == ["song1.mp3", "song2.wav", "song3.flac", "song4.ogg"]
+
+def test_iter_audio_files_symlink_loop(tmp_path):
+    """Following symlinks terminates and yields each file once despite a loop"""
+    nested_dir = tmp_path / "album"
+    nested_dir.mkdir()
+    (nested_dir / "track.mp3").write_text("Test content")
+    os.symlink(tmp_path, nested_dir / "loop")
+    
+    discovery_service = DiscoveryService(None, search_directories=[str(tmp_path)])
+    
+    discovery_service.follow_symlinks = False
+    assert [Path(path).name for path in discovery_service.iter_audio_files(str(tmp_path))] == ["track.mp3"]
+    
+    discovery_service.follow_symlinks = True
+    assert [Path(path).name for path in discovery_service.iter_audio_files(str(tmp_path))] == ["track.mp3"]
+
 if __name__ == "__main__":
     test_discovery()
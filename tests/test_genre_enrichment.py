@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Tests for the genre enrichment manager's lookup cache
+"""
+
+import requests
+from src.playlist_app.services import genre_enrichment
+from src.playlist_app.services.genre_enrichment import GenreEnrichmentManager
+
+def make_manager(monkeypatch, get):
+    """Create a manager whose HTTP sessions call `get` without rate limiting"""
+    manager = GenreEnrichmentManager()
+    monkeypatch.setattr("time.sleep", lambda seconds: None)
+    for _, service in manager.services:
+        monkeypatch.setattr(service.session, "get", get)
+    return manager
+
+def test_failed_lookups_are_not_cached(monkeypatch):
+    """Request errors must not be remembered as 'no genre'"""
+    calls = []
+
+    def get(*args, **kwargs):
+        calls.append(args)
+        raise requests.exceptions.ConnectionError("network down")
+
+    manager = make_manager(monkeypatch, get)
+
+    manager.enrich_metadata({'artist': 'x', 'title': 'y'})
+    first_calls = len(calls)
+    assert first_calls > 0
+
+    manager.enrich_metadata({'artist': 'x', 'title': 'y'})
+    assert len(calls) == 2 * first_calls
+    assert not manager._genre_cache
+
+def test_found_genres_are_cached(monkeypatch):
+    """A found genre is reused without querying the services again"""
+    calls = []
+
+    def enrich(metadata):
+        calls.append(metadata)
+        metadata['genre'] = 'Rock'
+        return metadata
+
+    manager = make_manager(monkeypatch, None)
+    monkeypatch.setattr(manager.musicbrainz_service, "enrich_metadata", enrich)
+
+    assert manager.enrich_metadata({'artist': 'x', 'title': 'y'})['genre'] == 'Rock'
+    assert manager.enrich_metadata({'artist': 'X', 'title': 'Y'})['genre'] == 'Rock'
+    assert len(calls) == 1
+
+def test_genre_cache_is_bounded(monkeypatch):
+    """The least recently used lookup is evicted once the cache is full"""
+    monkeypatch.setattr(genre_enrichment, "GENRE_CACHE_MAX_SIZE", 2)
+    manager = make_manager(monkeypatch, None)
+
+    manager._cache_genre(('a', '1', ''), 'Rock')
+    manager._cache_genre(('b', '2', ''), 'Jazz')
+    manager.enrich_metadata({'artist': 'a', 'title': '1'})  # refresh 'a'
+    manager._cache_genre(('c', '3', ''), 'Pop')
+
+    assert list(manager._genre_cache) == [('a', '1', ''), ('c', '3', '')]
+
+def test_active_services_follow_service_configuration(monkeypatch):
+    """Enabling a service is picked up without rebuilding the manager"""
+    manager = make_manager(monkeypatch, None)
+    manager.lastfm_service.enabled = False
+
+    assert 'Last.fm' not in [name for name, _ in manager.get_active_services()]
+
+    manager.lastfm_service.enabled = True
+    manager.lastfm_service.api_key = 'key'
+    assert 'Last.fm' in [name for name, _ in manager.get_active_services()]
+
+def test_reset_rebuilds_shared_manager():
+    """Reloading configuration drops the shared manager and its cache"""
+    manager = genre_enrichment.get_genre_enrichment_manager()
+    assert genre_enrichment.get_genre_enrichment_manager() is manager
+
+    genre_enrichment.reset_genre_enrichment_manager()
+    assert genre_enrichment.get_genre_enrichment_manager() is not manager